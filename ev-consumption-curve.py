@@ -23,16 +23,34 @@
 # SOFTWARE.
 
 
-import argparse
 import sys
-import textwrap
-from dataclasses import dataclass
-from typing import Tuple, Optional
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Final, Tuple, Optional
 
-if sys.version_info < (3, 7):
-    sys.exit("This script requires Python 3.7 or later.")
+import numpy as np
 
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the scalar kernel runs as pure Python.
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
 
+        return decorator
+
+
+if sys.version_info < (3, 10):
+    sys.exit("This script requires Python 3.10 or later.")
+
+
+_KMH_TO_MS: Final[float] = 1000 / 3600
+# 1 N = 1 Ws / m = (100 / 3600) · (kWh / 100km)
+_NEWTON_TO_KWH_100KM: Final[float] = 100 / 3600
+
+
+@lru_cache(maxsize=None)
 def air_density(temperature: float) -> float:
     """
     Air density (mass per unit volume) at a given temperature, in kg/m³.
@@ -53,11 +71,35 @@ def air_density(temperature: float) -> float:
 
 
 def kmh_to_meters_per_second(speed_kmh: float) -> float:
-    speed_ms = speed_kmh * (1000 / 3600)
-    return speed_ms
+    return speed_kmh * _KMH_TO_MS
+
+
+@njit(cache=True, fastmath=True)
+def _consumption_scalar(
+    mass: float,
+    drag_area: float,
+    drivetrain_efficiency: float,
+    rolling_resistance_coeff: float,
+    idle_power: float,
+    temperature: float,
+    speed_kmh: float,
+) -> float:
+    """
+    Scalar consumption kernel operating on primitive floats, so numba can
+    compile it to native code. The physical constants mirror air_density and
+    the Vehicle methods.
+    """
+    speed_ms = speed_kmh * _KMH_TO_MS
+    rho = 101325 / (287.053 * (273.15 + temperature))
+    rolling_resistance_force = rolling_resistance_coeff * mass * 9.81
+    air_drag_force = 0.5 * rho * drag_area * speed_ms * speed_ms
+    total_force = (
+        rolling_resistance_force + air_drag_force
+    ) / drivetrain_efficiency + idle_power / speed_ms
+    return total_force * _NEWTON_TO_KWH_100KM
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Vehicle:
     # We use MKS units unless specified otherwise.
     mass: float  # kg
@@ -65,43 +107,70 @@ class Vehicle:
     drivetrain_efficiency: float  # dimensionless
     rolling_resistance_coeff: float  # dimensionless
     idle_power: float  # Watt
+    # Independent of speed and temperature, so computed only once per instance.
+    _rolling_resistance_force: float = field(init=False, repr=False, compare=False)
 
-    def _rolling_resistance_force(self) -> float:
+    def __post_init__(self):
         STANDARD_GRAVITY = 9.81  # gravity on Earth's surface in m/s²
         normal_force = self.mass * STANDARD_GRAVITY
-        return self.rolling_resistance_coeff * normal_force
-
-    def _air_drag_force(self, speed: float, temperature: float) -> float:
-        return 0.5 * air_density(temperature=temperature) * self.drag_area * speed ** 2
-
-    def _idle_power_force(self, speed: float) -> float:
-        return self.idle_power / speed  # 1 W = 1 N·m / s
-
-    def _total_force(self, speed: float, temperature: float) -> float:
-        return (
-            self._rolling_resistance_force()
-            + self._air_drag_force(speed=speed, temperature=temperature)
-        ) / self.drivetrain_efficiency + self._idle_power_force(speed=speed)
+        object.__setattr__(
+            self, "_rolling_resistance_force", self.rolling_resistance_coeff * normal_force
+        )
 
     def consumption_in_kWh_per_100km(self, speed_kmh: float, temperature: float) -> float:
         """
         Energy consumption in kWh/100km for a given speed (km/h) and temperature (°C).
         """
-        speed_ms = kmh_to_meters_per_second(speed_kmh)
-        # 1 N = 1 Ws / m = (100 / 3600) · (kWh / 100km)
-        NEWTON_TO_KWH_100KM = 100 / 3600
-        return self._total_force(speed=speed_ms, temperature=temperature) * NEWTON_TO_KWH_100KM
+        return _consumption_scalar(
+            self.mass,
+            self.drag_area,
+            self.drivetrain_efficiency,
+            self.rolling_resistance_coeff,
+            self.idle_power,
+            temperature,
+            speed_kmh,
+        )
+
+    def consumption_curve_in_kWh_per_100km(
+        self, speeds_kmh: np.ndarray, temperature: float
+    ) -> np.ndarray:
+        """
+        Energy consumption in kWh/100km for an array of speeds (km/h) at a given
+        temperature (°C). Evaluates the closed form A + B·v² + C/v with the
+        coefficients computed once, so the whole curve is a single fused
+        NumPy expression.
+
+        The temperature may also be an array of shape (T,); the result then
+        broadcasts to one curve per temperature, shape (T, number of speeds).
+        """
+        temperature = np.asarray(temperature, dtype=float)
+        rho = np.reshape(
+            [air_density(t) for t in np.atleast_1d(temperature).tolist()],
+            temperature.shape,
+        )
+        A = self._rolling_resistance_force / self.drivetrain_efficiency
+        B = 0.5 * rho * self.drag_area / self.drivetrain_efficiency
+        C = self.idle_power
+        speeds_ms = kmh_to_meters_per_second(np.asarray(speeds_kmh, dtype=float))
+        return (
+            A + np.multiply.outer(B, speeds_ms * speeds_ms) + C / speeds_ms
+        ) * _NEWTON_TO_KWH_100KM
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Params:
     vehicle: Vehicle
-    temperature: float
+    temperatures: Tuple[float, ...]
     highway_consumption: Optional[float]
     max_speed: int
 
 
 def parse_params() -> Params:
+    # Imported here so that importing this module as a library does not pay
+    # for the CLI machinery.
+    import argparse
+    import textwrap
+
     def valid_range(min_value, max_value):
         def check_valid_range(value):
             fvalue = float(value)
@@ -113,6 +182,14 @@ def parse_params() -> Params:
 
         return check_valid_range
 
+    def valid_range_list(min_value, max_value):
+        check_valid_range = valid_range(min_value, max_value)
+
+        def check_valid_range_list(value):
+            return tuple(check_valid_range(part) for part in value.split(","))
+
+        return check_valid_range_list
+
     DEFAULT_LOAD_WEIGHT = 90
     DEFAULT_DRAG_COEFFICIENT = 0.27
 
@@ -198,9 +275,10 @@ def parse_params() -> Params:
     )
     parser.add_argument(
         "--temperature",
-        type=valid_range(-90, 60),
-        help="Temperature (°C), typically −15–35. Default: %(default)s.",
-        default=20,
+        type=valid_range_list(-90, 60),
+        help="Temperature (°C), typically −15–35, or a comma-separated list of"
+        " temperatures to get one curve per line. Default: %(default)s.",
+        default="20",
     )
     parser.add_argument(
         "--max-speed",
@@ -214,13 +292,13 @@ def parse_params() -> Params:
         parser.error("Need either --weight or --curb-weight.")
     if args.weight and args.curb_weight:
         parser.error("Cannot have both --weight and --curb-weight.")
-    if args.drag_area and any(
-        (args.drag_coefficient, args.frontal_area, args.width, args.height)
+    if args.drag_area and (
+        args.drag_coefficient or args.frontal_area or args.width or args.height
     ):
         parser.error(
             "If --drag-area is given, cannot use --drag-coefficient, --frontal-area, --width, or --height."
         )
-    if args.frontal_area and any((args.width, args.height)):
+    if args.frontal_area and (args.width or args.height):
         parser.error("If --frontal-area is given, cannot use --width or --height.")
     if (args.width is None) != (args.height is None):
         parser.error("Both --width and --height must be given together.")
@@ -258,7 +336,7 @@ def parse_params() -> Params:
     )
     return Params(
         vehicle=vehicle,
-        temperature=args.temperature,
+        temperatures=args.temperature,
         highway_consumption=highway_consumption,
         max_speed=int(args.max_speed),
     )
@@ -267,28 +345,30 @@ def parse_params() -> Params:
 def main():
     params = parse_params()
 
-    if params.highway_consumption:
-        scaling_factor = (
-            params.highway_consumption
-            / params.vehicle.consumption_in_kWh_per_100km(speed_kmh=110, temperature=23)
-        )
-    else:
-        scaling_factor = 1.0
-
     MIN_SPEED = 10
     SPEED_STEP = 10
-    SPEEDS = range(MIN_SPEED, params.max_speed + 1, SPEED_STEP)
-    curve = [
-        (
-            speed,
-            scaling_factor
-            * params.vehicle.consumption_in_kWh_per_100km(
-                speed_kmh=speed, temperature=params.temperature
-            ),
+    speeds_kmh = np.arange(MIN_SPEED, params.max_speed + 1, SPEED_STEP)
+    # One broadcast evaluation yields one curve per temperature, shape (T, V).
+    consumptions = params.vehicle.consumption_curve_in_kWh_per_100km(
+        speeds_kmh=speeds_kmh, temperature=np.asarray(params.temperatures)
+    )
+
+    if params.highway_consumption:
+        # One scalar evaluation of the same closed form as the curves above.
+        reference_consumption = float(
+            params.vehicle.consumption_curve_in_kWh_per_100km(
+                speeds_kmh=110, temperature=23
+            )
         )
-        for speed in SPEEDS
+        consumptions *= params.highway_consumption / reference_consumption
+
+    # .tolist() unboxes the arrays to native Python values in one C-level pass.
+    speeds = speeds_kmh.tolist()
+    lines = [
+        ":".join(f"{s},{c:.2f}" for s, c in zip(speeds, row))
+        for row in consumptions.tolist()
     ]
-    print(":".join(f"{s},{c:.2f}" for (s, c) in curve))
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":